@@ -71,11 +71,15 @@ Empty = _Empty()
 
 class BaseDimension(object):
 
+    __slots__ = ()
+
     def __repr__(self):
         return "<{}>".format(self.__class__.__name__)
 
 class Dimension(BaseDimension):
 
+    __slots__ = ("_size", "_range", "_name")
+
     is_finite = True
     is_infinite = False
 
@@ -110,6 +114,8 @@ class Dimension(BaseDimension):
 
 class _InfiniteDimension(BaseDimension):
 
+    __slots__ = ()
+
     chunk_size = 10
     is_finite = False
     is_infinite = True
@@ -233,6 +239,12 @@ class Board(object):
     class InvalidDimensionsError(BoardError): pass
     class OutOfBoundsError(BoardError): pass
 
+    #
+    # Boards with no more positions than this remember the immediate
+    # neighbours of each position once they've been found
+    #
+    small_board_threshold = 10000
+
     def __init__(self, dimension_sizes, _global_board=None, _offset_from_global=None):
         """Set up a n-dimensional board
         """
@@ -246,6 +258,23 @@ class Board(object):
             raise self.InvalidDimensionsError("Each dimension must be >= 1")
         self.dimensions = [InfiniteDimension if size == Infinity else Dimension(size, name="Dimension-%s" % (n + 1)) for (n, size) in enumerate(dimension_sizes)]
 
+        #
+        # Dimensions don't change once the board is created, so keep their
+        # sizes as plain integers. The upper bounds are the same except that
+        # an infinite dimension really has none, which lets bounds checks
+        # compare numbers directly rather than asking each dimension in turn.
+        #
+        self._shape = tuple(len(d) for d in self.dimensions)
+        self._upper_bounds = tuple(float("inf") if d.is_infinite else len(d) for d in self.dimensions)
+        self._is_all_finite = all(d.is_finite for d in self.dimensions)
+        self._has_finite_dimensions = any(d.is_finite for d in self.dimensions)
+        if self._is_all_finite:
+            self._length = functools.reduce(lambda a, b: a * b, self._shape)
+        else:
+            self._length = Infinity
+        self._iteration_ranges = tuple(range(d.chunk_size) if d.is_infinite else range(len(d)) for d in self.dimensions)
+        self._full_slice = (slice(0, None),) * len(self.dimensions)
+
         #
         # This can be a sub-board of another board: a slice.
         # If that's the case, the boards share a common data structure
@@ -253,8 +282,17 @@ class Board(object):
         # NB this means that if a slice is taken of a slice, the offset must itself be offset!
         #
         self._data = {} if _global_board is None else _global_board
+        self._owns_data = _global_board is None
         self._offset_from_global = _offset_from_global or tuple(0 for _ in self.dimensions)
+        #
+        # The upper bounds of this board in global coordinates, so that
+        # shared data can be filtered without translating every key
+        #
+        self._global_upper_bounds = tuple(o + u for (o, u) in zip(self._offset_from_global, self._upper_bounds))
         self._sprite_cache = {}
+        self._neighbours_cache = {}
+        self._remembers_neighbours = self._is_all_finite and self._length <= self.small_board_threshold
+        self._snapshot = None
 
     def __repr__(self):
         return "<{} ({})>".format(
@@ -265,20 +303,25 @@ class Board(object):
     def __eq__(self, other):
         return \
             self.dimensions == other.dimensions and \
-            dict(self.iterdata()) == dict(other.iterdata())
+            self.asdict() == other.asdict()
 
     def __len__(self):
         #
         # Return the total number of positions on the board. If any of
-        # the dimensions is infinite, the total will be Infinity
+        # the dimensions is infinite, the total will be Infinity. This
+        # can't change once the board is created so it's calculated then.
         #
-        if any(d.is_infinite for d in self.dimensions):
-            return Infinity
-        else:
-            return functools.reduce(lambda a, b: a * b, (len(d) for d in self.dimensions))
+        return self._length
 
     def __bool__(self):
-        return any(coord for coord in self._data if self._is_in_bounds(coord))
+        #
+        # A board is true if it has any data within its bounds. A board
+        # which owns its data only holds data within its bounds; a slice
+        # needs to look for the first item within its own space.
+        #
+        if self._owns_data:
+            return bool(self._data)
+        return any(True for _ in self.iterdata())
     __nonzero__ = __bool__
 
     @property
@@ -289,12 +332,32 @@ class Board(object):
     @property
     def has_finite_dimensions(self):
         """Does this board have at least one finite dimension?"""
-        return any(d.is_finite for d in self.dimensions)
+        return self._has_finite_dimensions
 
     @property
     def has_infinite_dimensions(self):
         """Does this board have at least one infinite dimension?"""
-        return any(d.is_infinite for d in self.dimensions)
+        return not self._is_all_finite
+
+    @property
+    def shape(self):
+        """The size of each dimension, Infinity for an infinite dimension"""
+        return self._shape
+
+    @property
+    def iteration_ranges(self):
+        """The range covered along each dimension by the first chunk of
+        iteration: the whole of a finite dimension, or the first chunk of
+        an infinite one. For an entirely finite board this is every coordinate.
+        """
+        return self._iteration_ranges
+
+    @property
+    def full_slice(self):
+        """The slices which cover the whole of this board, eg for a
+        linked copy of the whole board: b2 = b1[b1.full_slice]
+        """
+        return self._full_slice
 
     def dumped(self):
         is_offset = any(o for o in self._offset_from_global)
@@ -309,7 +372,7 @@ class Board(object):
                 global_coord = " => {}".format(self._to_global(coord))
             else:
                 global_coord = ""
-            data = " [{}]".format(self[coord] if self[coord] is not None else "")
+            data = " [{}]".format(value if value is not None else "")
             yield "  {}{}{}".format(coord, global_coord, data)
         yield "}"
 
@@ -320,11 +383,14 @@ class Board(object):
     def _is_in_bounds(self, coord):
         """Is a given coordinate within the space of this board?
         """
-        if len(coord) != len(self.dimensions):
+        if len(coord) != len(self._shape):
             raise self.InvalidDimensionsError(
                 "Coordinate {} has {} dimensions; the board has {}".format(coord, len(coord), len(self.dimensions)))
 
-        return all(c in d for (c, d) in zip(coord, self.dimensions))
+        #
+        # As with range, only whole numbers are in bounds
+        #
+        return all(0 <= c < u and c % 1 == 0 for (c, u) in zip(coord, self._upper_bounds))
 
     def _check_in_bounds(self, coord):
         """If a given coordinate is not within the space of this baord, raise
@@ -333,6 +399,12 @@ class Board(object):
         if not self._is_in_bounds(coord):
             raise self.OutOfBoundsError("{} is out of bounds for {}".format(coord, self))
 
+    def _check_integer_coord(self, coord):
+        """If any element of a coordinate is not an integer, raise a TypeError
+        """
+        if not all(isinstance(c, (int, long)) for c in coord):
+            raise TypeError("{} coordinates must be integers, not {}".format(self.__class__.__name__, coord))
+
     def __contains__(self, coord):
         """Implement <coord> in <board>
         """
@@ -345,22 +417,24 @@ class Board(object):
         use iterdata().
         """
         # If all the dimensions are finite (the simplest and most common
-        # situation) just use itertools.product.
+        # situation) just hand back itertools.product: it's already an
+        # iterator and doesn't need wrapping in a generator.
+        if self._is_all_finite:
+            return itertools.product(*self.dimensions)
+        else:
+            return self._iterchunks()
 
+    def _iterchunks(self):
         # If any dimension is infinite, we can't use itertools.product
         # directly because it consumes its arguments in order to make
         # up the axes for its Cartesian join. Instead, we chunk through
         # any infinite dimensions, while repeating the finite ones.
-        if any(d.is_infinite for d in self.dimensions):
-            start, chunk = 0, InfiniteDimension.chunk_size
-            while True:
-                iterators = [d[start:start+chunk] if d[-1] == Infinity else iter(d) for d in self.dimensions]
-                for coord in itertools.product(*iterators):
-                    yield coord
-                start += chunk
-        else:
-            for coord in itertools.product(*self.dimensions):
+        start, chunk = 0, InfiniteDimension.chunk_size
+        while True:
+            iterators = [d[start:start+chunk] if d.is_infinite else iter(d) for d in self.dimensions]
+            for coord in itertools.product(*iterators):
                 yield coord
+            start += chunk
 
     def _to_global(self, coord):
         return tuple(c + o for (c, o) in zip(coord, self._offset_from_global))
@@ -373,14 +447,34 @@ class Board(object):
 
         Generate the list of data in local coordinate terms.
         """
+        if self._owns_data:
+            for item in self._data.items():
+                yield item
+        else:
+            for gcoord, value in self._iterglobaldata():
+                yield self._from_global(gcoord), value
+
+    def _iterglobaldata(self):
+        """Generate the (global coordinate, data) pairs within this board
+        from the data it shares with its parent
+
+        Keys are compared against the board's bounds in global terms so that
+        only those which fall within it need translating to local coordinates.
+        """
+        lower, upper = self._offset_from_global, self._global_upper_bounds
         for gcoord, value in self._data.items():
-            lcoord = self._from_global(gcoord)
-            if self._is_in_bounds(lcoord):
-                yield lcoord, value
+            if all(l <= c < u for (c, l, u) in zip(gcoord, lower, upper)):
+                yield gcoord, value
 
     def lendata(self):
         """Return the number of data items populated
         """
+        #
+        # A board which owns its data holds nothing out of bounds, so
+        # the number of items is simply the size of its data
+        #
+        if self._owns_data:
+            return len(self._data)
         return sum(1 for _ in self.iterdata())
 
     def iterline(self, coord, vector, max_steps=None):
@@ -420,8 +514,6 @@ class Board(object):
         return list(itertools.product(*dimension_bounds))
 
     def edges(self):
-        for corner in corners:
-
         return (pair for pair in itertools.combinations(self.corners(), 2) if any(a == b for (a, b) in zip(*pair)))
 
     def diagonals(self):
@@ -436,16 +528,50 @@ class Board(object):
         """
         board = self.__class__(tuple(len(d) for d in self.dimensions))
         if with_data:
-            for coord, value in self.iterdata():
-                board._data[coord] = value
+            board._data = self.asdict()
         return board
 
+    def asdict(self):
+        """Return a new dictionary mapping each populated (local) coordinate
+        to its data. Changing the dictionary doesn't change the board.
+        """
+        #
+        # If this board owns its data then everything in it is within
+        # bounds and can be copied wholesale. A slice shares its parent's
+        # data so only the local part of that data is copied.
+        #
+        if self._owns_data:
+            return self._data.copy()
+        else:
+            return dict(self.iterdata())
+
     def clear(self):
         """Clear the data which belongs to this board, possibly a sub-board
         of a larger board.
         """
-        for lcoord, value in list(self.iterdata()):
-            del self._data[self._to_global(lcoord)]
+        if self._owns_data:
+            self._data.clear()
+        else:
+            for gcoord, value in list(self._iterglobaldata()):
+                del self._data[gcoord]
+
+    def snapshot(self):
+        """Remember the data which belongs to this board so that it can
+        later be restored by .reset
+        """
+        if self._owns_data:
+            self._snapshot = self._data.copy()
+        else:
+            self._snapshot = dict(self._iterglobaldata())
+
+    def reset(self):
+        """Restore the data remembered by the most recent .snapshot,
+        discarding any changes made to this board since then.
+        """
+        if self._snapshot is None:
+            raise self.BoardError("No snapshot has been taken of {}".format(self))
+        self.clear()
+        self._data.update(self._snapshot)
 
     def __getitem__(self, item):
         """The item is either a tuple of numbers, representing a single
@@ -484,30 +610,41 @@ class Board(object):
         If a negative number is given, apply the usual subscript maths
         to come up with an index from the end of the dimension.
         """
-        if len(coord) != len(self.dimensions):
+        if len(coord) != len(self._shape):
             raise IndexError("Coordinate {} has {} dimensions; the board has {}".format(coord, len(coord), len(self.dimensions)))
 
         #
         # Account for negative indices in the usual way, allowing
         # for the fact that you can't use negative indices if the
-        # dimension is infinite
+        # dimension is infinite. Most coordinates have no negative
+        # indices at all so only look further if one does.
         #
-        if any(d is InfiniteDimension and c < 0 for (c, d) in zip(coord, self.dimensions)):
-            raise IndexError("Cannot use negative index {} on an infinite dimension".format(c))
-        normalised_coord = tuple(len(d) + c if c < 0 else c for (c, d) in  zip(coord, self.dimensions))
-        self._check_in_bounds(normalised_coord)
-        return self._to_global(normalised_coord)
+        if any(c < 0 for c in coord):
+            for (c, d) in zip(coord, self.dimensions):
+                if d is InfiniteDimension and c < 0:
+                    raise IndexError("Cannot use negative index {} on an infinite dimension".format(c))
+            coord = tuple(s + c if c < 0 else c for (c, s) in zip(coord, self._shape))
+
+        #
+        # A single pass over the coordinate decides whether it's in bounds
+        # (and, as with range, only whole numbers are)
+        #
+        if not all(0 <= c < u and c % 1 == 0 for (c, u) in zip(coord, self._upper_bounds)):
+            raise self.OutOfBoundsError("{} is out of bounds for {}".format(coord, self))
+        if self._owns_data:
+            return tuple(coord)
+        return self._to_global(coord)
 
     def _slice(self, slices):
         """Produce a subset of this board linked to the same underlying data.
         """
-        if len(slices) != len(self.dimensions):
+        if len(slices) != len(self._shape):
             raise IndexError("Slices {} have {} dimensions; the board has {}".format(slices, len(slices), len(self.dimensions)))
 
         #
         # Determine the start/stop/step for all the slices
         #
-        slice_indices = [slice.indices(len(dimension)) for (slice, dimension) in zip(slices, self.dimensions)]
+        slice_indices = [slice.indices(size) for (slice, size) in zip(slices, self._shape)]
         if any(abs(step) != 1 for start, stop, step in slice_indices):
             raise IndexError("At least one of slices {} has a stride other than 1".format(slices))
 
@@ -549,8 +686,12 @@ class Board(object):
         """Return the bounding box of space occupied
         """
         coords_in_use = [coord for coord, _ in self.iterdata()]
-        min_coord = tuple(min(coord) for coord in zip(*coords_in_use))
-        max_coord = tuple(max(coord) for coord in zip(*coords_in_use))
+        #
+        # Transpose once to get all the values along each dimension
+        #
+        dimension_values = list(zip(*coords_in_use))
+        min_coord = tuple(min(values) for values in dimension_values)
+        max_coord = tuple(max(values) for values in dimension_values)
         return min_coord, max_coord
 
     def occupied_board(self):
@@ -578,30 +719,119 @@ class Board(object):
         For a given coordinate, yield each of its nearest neighbours along
         all dimensions, including diagonal neighbours if requested (the default)
         """
+        coord = tuple(coord)
+        dimension_size = len(self.dimensions)
+        if len(coord) != dimension_size:
+            raise self.InvalidDimensionsError(
+                "Coordinate {} has {} dimensions; the board has {}".format(coord, len(coord), dimension_size))
+        self._check_integer_coord(coord)
+
+        #
+        # The neighbours of a coordinate depend only on the board's bounds,
+        # which never change, so on a small board remember the immediate
+        # neighbours of each position the first time they're asked for.
+        # Only on-board positions and the default radius are remembered,
+        # so at most two entries are kept for each position on the board.
+        # (A large or infinite board would keep too many.)
+        #
+        if include_diagonals:
+            find_neighbours = self._diagonal_neighbours
+        else:
+            find_neighbours = self._axis_neighbours
+        if not (self._remembers_neighbours and radius == 1 and self._is_in_bounds(coord)):
+            return iter(find_neighbours(coord, radius))
+        key = coord, include_diagonals
+        try:
+            neighbours = self._neighbours_cache[key]
+        except KeyError:
+            neighbours = self._neighbours_cache[key] = tuple(find_neighbours(coord, radius))
+        return iter(neighbours)
+
+    def _diagonal_neighbours(self, coord, radius):
+        """Return a list of all the on-board points within the radius of a
+        coordinate, including those which differ along more than one dimension
+        """
+        #
+        # Every point within the radius is a neighbour, so clip the
+        # range along each dimension to the board first: the product
+        # of those ranges is then exactly the on-board neighbours
+        # (plus the coordinate itself) with no bounds check per point.
+        # An infinite dimension's upper bound is float("inf"), which
+        # min will never choose over an integer.
+        #
+        ranges = [range(max(0, c - radius), min(u, c + radius + 1)) for (c, u) in zip(coord, self._upper_bounds)]
+        return [neighbour for neighbour in itertools.product(*ranges) if neighbour != coord]
+
+    def _axis_neighbours(self, coord, radius):
+        """Return a list of the on-board points within the radius of a
+        coordinate which differ from it along only one dimension
+        """
+        # exclude zero from possible radii as we're only producing radials
+        radius_points = list(r for r in range(-1 * radius, radius + 1) if r != 0)
+        #
+        # Most coordinates on a board are far enough from every edge
+        # that all the moves stay on the board, so nothing need be checked
+        #
+        if all(radius <= c < u - radius for (c, u) in zip(coord, self._upper_bounds)):
+            return [
+                coord[:n] + (c + r,) + coord[n + 1:]
+                for r in radius_points
+                for n, c in enumerate(coord)
+            ]
+        #
+        # Each neighbour moves along exactly one dimension, so only that
+        # element needs checking against the board, provided all the
+        # other elements of the coordinate are on the board already.
+        #
+        on_board = [0 <= c < u for (c, u) in zip(coord, self._upper_bounds)]
+        n_off_board = on_board.count(False)
+        return [
+            coord[:n] + (c + r,) + coord[n + 1:]
+            for r in radius_points
+            for n, (c, u) in enumerate(zip(coord, self._upper_bounds))
+            if n_off_board - (not on_board[n]) == 0 and 0 <= c + r < u
+        ]
+
+    def neighbour_count(self, coord, include_diagonals=True, radius=1):
+        """Return the number of neighbours of a coordinate
+
+        This is the number which .neighbours would yield with the same
+        arguments, worked out from the board's bounds without generating
+        any of the neighbouring coordinates.
+        """
+        coord = tuple(coord)
         dimension_size = len(self.dimensions)
-        #if including all possible points within radius.
+        if len(coord) != dimension_size:
+            raise self.InvalidDimensionsError(
+                "Coordinate {} has {} dimensions; the board has {}".format(coord, len(coord), dimension_size))
+        self._check_integer_coord(coord)
+
+        #
+        # How many positions within the radius of each element (including
+        # the element itself) fall on the board along that dimension. An
+        # infinite dimension's upper bound is float("inf"), so it never
+        # limits the reach.
+        #
+        in_reach = [max(0, min(u, c + radius + 1) - max(0, c - radius)) for (c, u) in zip(coord, self._upper_bounds)]
+        on_board = [0 <= c < u for (c, u) in zip(coord, self._upper_bounds)]
         if include_diagonals:
-            radius_points = range(-1 * radius, radius + 1)
-            # all offsets within radius excluding origin (0,0,...,0)
-            offsets = (offset for offset in itertools.product(*(radius_points for d in self.dimensions))
-                       if not all(o == 0 for o in offset))
+            #
+            # The neighbours are every combination of those positions,
+            # less the coordinate itself if it's on the board
+            #
+            return functools.reduce(lambda a, b: a * b, in_reach) - all(on_board)
         else:
-            # exclude zero from possible radii as we're only producing radials
-            radius_points = list(r for r in range(-1 * radius, radius + 1) if r != 0)
-            # values project out from origin on each dimension.
-            # for example in 2d this produces (1,0), (0,1) in 3d (1,0,0), (0,1,0), (0,0,1)
-            dimension_identity = list(tuple(1 if i == j else 0 for j in range(dimension_size))
-                                      for i in range(dimension_size))
-            # for each dimension_identity, yield each radii
-            offsets = (tuple(rsi*i for i in d) for rsi in radius_points for d in dimension_identity)
-
-        for offset in offsets:
             #
-            # Diagonal offsets change in more than one dimension.
+            # Moving along one dimension only stays on the board if every
+            # other element is on the board already; the element's own
+            # position is in reach if it's on the board, but isn't a move.
             #
-            neighbour = tuple(c + o for (c, o) in zip(coord, offset))
-            if self._is_in_bounds(neighbour):
-                yield neighbour
+            n_off_board = on_board.count(False)
+            return sum(
+                n - on_board[i]
+                for (i, n) in enumerate(in_reach)
+                if n_off_board - (not on_board[i]) == 0
+            )
 
     def runs_of_n(self, n, ignore_reversals=True):
         """Iterate over all dimensions to yield runs of length n
@@ -680,12 +910,33 @@ class Board(object):
         With a coordinate iterable this could be used, for example, to combine
         iterline and a list of objects to populate data on a Battleships board.
         """
+        if coord_iterable is None and not self.is_offset:
+            #
+            # The board's own coordinates are always in bounds and, when
+            # there's no offset, local and global coordinates are the same.
+            # So the data can be loaded in one go without checking and
+            # translating each coordinate through __setitem__
+            #
+            self._data.update(zip(iter(self), iter(iterable)))
+            return
+
         if coord_iterable is None:
             board_iter = iter(self)
         else:
             board_iter = iter(coord_iterable)
-        for coord, value in zip(board_iter, iter(iterable)):
-            self[coord] = value
+        self.update(zip(board_iter, iter(iterable)))
+
+    def update(self, items):
+        """Set the data at several coordinates in one go
+
+        The items can be a mapping from coordinate to data, or an iterable
+        of (coordinate, data) pairs such as the output of .iterdata. Every
+        coordinate is checked (and translated) before any data is changed,
+        so if one is out of bounds the board is left as it was.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        self._data.update([(self._normalised_coord(coord), value) for (coord, value) in items])
 
     def draw(self, callback=str, use_borders=True):
         """Draw the board in a very simple text layout
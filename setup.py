@@ -16,6 +16,9 @@ setup(
     license="unlicensed",
     url='https://github.com/tjguk/dojo-board',
     py_modules=['board'],
+    #
+    # The module supports 2.7 and 3.x; the tests (test.py) need 3.8+
+    #
     classifiers=[
         "Environment :: Console",
         "Intended Audience :: Developers",
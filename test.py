@@ -1,17 +1,15 @@
 #!python3
 #
-# The semantics of 3.x range are broadly equivalent
-# to xrange in 2.7
+# board.py itself still supports Python 2.7, but the tests use
+# Python 3 features (subTest, itertools.zip_longest, math.prod)
+# and need Python 3.8 or later
 #
-try:
-    range = xrange
-except NameError:
-    pass
-
-import functools
 import itertools
+import math
+import operator
+import sys
 import unittest
-from board import Board, Infinity, Empty, InfiniteDimension
+from board import Board, Infinity, Empty
 
 #
 # The most likely false assumptions in the code will be:
@@ -30,15 +28,54 @@ from board import Board, Infinity, Empty, InfiniteDimension
 
 class BoardTest(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        #
+        # Build and populate the (non-sliced) boards once for the whole
+        # run: they're held on BoardTest itself and shared by every test
+        # class. Each test then works on copies of these so that changes
+        # made by one test can't leak into another.
+        #
+        if "_templates" in vars(BoardTest):
+            return
+        BoardTest._b1 = Board((1, 1))
+        BoardTest._b44 = Board((4, 4))
+        BoardTest._b333 = Board((3, 3, 3))
+        BoardTest._b5555 = Board((5, 5, 5, 5))
+        BoardTest._b3i = Board((3, Infinity))
+        BoardTest._bii = Board((Infinity, Infinity))
+        BoardTest._templates = [
+            ("1d", BoardTest._b1),
+            ("2d", BoardTest._b44),
+            ("3d", BoardTest._b333),
+            ("4d", BoardTest._b5555),
+            ("3inf", BoardTest._b3i),
+            ("inf", BoardTest._bii)
+        ]
+
+        #
+        # The test data set must be enough to fill all of the finite boards.
+        # It's held as a tuple as it's iterated, indexed and reversed by
+        # different tests.
+        #
+        BoardTest._size = max(len(b) for name, b in BoardTest._templates if not b.has_infinite_dimensions)
+        BoardTest.test_data = tuple(range(BoardTest._size))
+        for name, board in BoardTest._templates:
+            board.populate(BoardTest.test_data)
+
     def setUp(self):
-        self.b1 = Board((1, 1))
-        self.b44 = Board((4, 4))
-        self.b333 = Board((3, 3, 3))
-        self.b5555 = Board((5, 5, 5, 5))
+        self.b1 = self._b1.copy(with_data=True)
+        self.b44 = self._b44.copy(with_data=True)
+        self.b333 = self._b333.copy(with_data=True)
+        self.b5555 = self._b5555.copy(with_data=True)
+        #
+        # The slices must be taken from this test's copy of the board so
+        # that they are linked to it rather than to the class-wide one
+        #
         self.b33 = self.b44[1:, 1:]
         self.b22 = self.b33[1:, 1:]
-        self.b3i = Board((3, Infinity))
-        self.bii = Board((Infinity, Infinity))
+        self.b3i = self._b3i.copy(with_data=True)
+        self.bii = self._bii.copy(with_data=True)
 
         self.boards = [
             ("1d", self.b1),
@@ -51,16 +88,17 @@ class BoardTest(unittest.TestCase):
             ("inf", self.bii)
         ]
 
-        #
-        # The test data set must be enough to fill all of the finite boards
-        #
-        size_of_test_data = max(len(b) for name, b in self.boards if not b.has_infinite_dimensions)
-        self.test_data = range(size_of_test_data)
-        for name, board in self.boards:
-            if not board.is_offset:
-                board.populate(self.test_data)
+    def assertIteratesAs(self, actual, expected, msg=None):
+        """Compare two iterables item by item, stopping at the first
+        difference, without building a list of either
+        """
+        missing = object()
+        for a, e in itertools.zip_longest(actual, expected, fillvalue=missing):
+            self.assertEqual(e, a, msg)
 
-class BoardCreationTest(BoardTest):
+class BoardCreationTest(unittest.TestCase):
+    """These build their own boards, so need none of the shared fixtures
+    """
 
     def test_empty(self):
         """An exception is raised when a board is created with no dimensions
@@ -84,10 +122,11 @@ class BoardCreationTest(BoardTest):
         """Create each of 1- to 10-dimensional boards
         """
         for n in range(1, 10):
-            b = Board(tuple(1 for i in range(n)))
-            actual = len(b.dimensions)
-            expected = n
-            self.assertEqual(expected, actual)
+            with self.subTest(n=n):
+                b = Board((1,) * n)
+                actual = len(b.dimensions)
+                expected = n
+                self.assertEqual(expected, actual)
 
     def test_one_infinite_dim(self):
         """Create a board with one infinite dimension
@@ -101,9 +140,9 @@ class BoardCreationTest(BoardTest):
         """Create a board with every dimension infinite (a la Minecraft)
         """
         b = Board((Infinity, Infinity, Infinity))
-        self.assertEqual(len(b.dimensions[0]), Infinity)
-        self.assertEqual(len(b.dimensions[1]), Infinity)
-        self.assertEqual(len(b.dimensions[2]), Infinity)
+        for n, d in enumerate(b.dimensions):
+            with self.subTest(dimension=n):
+                self.assertEqual(len(d), Infinity)
 
 class BoardDump(BoardTest):
 
@@ -113,12 +152,12 @@ class BoardDump(BoardTest):
         # plus the curly brackets with no content (3 rows)
         #
         for name, board in self.boards:
-            board.clear()
-            dumped = list(board.dumped())
+            with self.subTest(name=name):
+                board.clear()
 
-            expected = 3
-            actual = len(dumped)
-            self.assertEqual(expected, actual, name)
+                expected = 3
+                actual = sum(1 for line in board.dumped())
+                self.assertEqual(expected, actual, name)
 
     def test_dumped(self):
         #
@@ -127,11 +166,10 @@ class BoardDump(BoardTest):
         # each item of contents
         #
         for name, board in self.boards:
-            dumped = list(board.dumped())
-
-            expected = 3 + board.lendata()
-            actual = len(dumped)
-            self.assertEqual(expected, actual, name)
+            with self.subTest(name=name):
+                expected = 3 + board.lendata()
+                actual = sum(1 for line in board.dumped())
+                self.assertEqual(expected, actual, name)
 
 class BoardContains(BoardTest):
     """A coordinate is considered to be "in" a board if
@@ -141,24 +179,26 @@ class BoardContains(BoardTest):
 
     def test_contains(self):
         for name, board in self.boards:
-            #
-            # Each board will have at least an upper left position
-            #
-            coord = tuple(0 for d in board.dimensions)
-            self.assertTrue(coord in board, name)
+            with self.subTest(name=name):
+                #
+                # Each board will have at least an upper left position
+                #
+                coord = (0,) * len(board.dimensions)
+                self.assertTrue(coord in board, name)
 
     def test_does_not_contain(self):
         for name, board in self.boards:
-            #
-            # The entirely infinite board contains every coordinate
-            #
-            if name == "inf":
-                continue
-            #
-            # Construct a coordinate beyond each of the dimensions
-            #
-            coord = tuple(2 + len(d) for d in board.dimensions)
-            self.assertFalse(coord in board, name)
+            with self.subTest(name=name):
+                #
+                # The entirely infinite board contains every coordinate
+                #
+                if name == "inf":
+                    continue
+                #
+                # Construct a coordinate beyond each of the dimensions
+                #
+                coord = tuple(2 + s for s in board.shape)
+                self.assertFalse(coord in board, name)
 
     def test_inf_contains_everything(self):
         board = self.bii
@@ -166,14 +206,21 @@ class BoardContains(BoardTest):
         # Construct a coordinate beyond each of the dimensions.
         # This will nonetheless be contained in the board
         #
-        coord = tuple(2 + len(d) for d in board.dimensions)
+        coord = tuple(2 + s for s in board.shape)
         self.assertTrue(coord in board)
 
+    def test_does_not_contain_fractions(self):
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                coord = (0.5,) * len(board.dimensions)
+                self.assertFalse(coord in board, name)
+
     def test_contain_with_wrong_dimensionality(self):
         for name, board in self.boards:
-            coord = tuple(1 for _ in board.dimensions) + (1,)
-            with self.assertRaises(Board.InvalidDimensionsError, msg=name):
-                coord in board
+            with self.subTest(name=name):
+                coord = (1,) * len(board.dimensions) + (1,)
+                with self.assertRaises(Board.InvalidDimensionsError, msg=name):
+                    coord in board
 
 class BoardIteration(BoardTest):
     """A board iterates coordinates across all its dimensions in
@@ -189,15 +236,20 @@ class BoardIteration(BoardTest):
 
     def test_finite_iteration(self):
         for name, board in self.boards:
-            #
-            # Skip any boards with an infinite dimension; these are tested
-            # separately
-            #
-            if any(len(d) == Infinity for d in board.dimensions):
-                continue
-            expected = set(itertools.product(*board.dimensions))
-            actual = set(board)
-            self.assertSetEqual(expected, actual, name)
+            with self.subTest(name=name):
+                #
+                # Skip any boards with an infinite dimension; these are tested
+                # separately
+                #
+                if Infinity in board.shape:
+                    continue
+                #
+                # The order of iteration is underspecified, so sort the board's
+                # coordinates. The product is already generated in sorted order.
+                #
+                expected = list(itertools.product(*board.dimensions))
+                actual = sorted(board)
+                self.assertEqual(expected, actual, name)
 
     def test_infinite_iteration(self):
         #
@@ -205,11 +257,14 @@ class BoardIteration(BoardTest):
         # to match one chunk for each of the infinite dimensions.
         #
         for name, board in self.boards:
-            if all(len(d) != Infinity for d in board.dimensions):
-                continue
-            ranges = [(range(d.chunk_size) if d is InfiniteDimension else d) for d in board.dimensions]
-            expected = itertools.product(*ranges)
-            self.assertTrue(all(a == b for a, b in zip(expected, board)), name)
+            with self.subTest(name=name):
+                if Infinity not in board.shape:
+                    continue
+                ranges = board.iteration_ranges
+                n_coords = math.prod(len(r) for r in ranges)
+                expected = itertools.product(*ranges)
+                actual = itertools.islice(board, n_coords)
+                self.assertIteratesAs(actual, expected, name)
 
     def test_iterdata(self):
         #
@@ -218,31 +273,33 @@ class BoardIteration(BoardTest):
         # boards with at least one infinite dimension)
         #
         for name, board in self.boards:
-            #
-            # FIXME: for now, skip offset boards
-            #
-            if board.is_offset:
-                continue
-            if board.has_infinite_dimensions:
-                data_length = Infinity
-            else:
-                data_length = functools.reduce(lambda a, b: a * b, (len(d) for d in board.dimensions))
-            expected = set(data for data, _ in zip(self.test_data, range(data_length)))
-            actual = set(data for coord, data in board.iterdata())
-            self.assertSetEqual(expected, actual, name)
+            with self.subTest(name=name):
+                #
+                # FIXME: for now, skip offset boards
+                #
+                if board.is_offset:
+                    continue
+                if board.has_infinite_dimensions:
+                    data_length = Infinity
+                else:
+                    data_length = math.prod(board.shape)
+                expected = self.test_data[:data_length]
+                actual = [data for coord, data in board.iterdata()]
+                self.assertCountEqual(expected, actual, name)
 
     def test_itercoords(self):
         #
         # itercoords generates all the coordinates between two corners
         #
         for name, board in self.boards:
-            coord1 = tuple(0 for d in board.dimensions)
-            coord2 = tuple(3 if d.is_infinite else len(d) - 1 for d in board.dimensions)
+            with self.subTest(name=name):
+                coord1 = (0,) * len(board.dimensions)
+                coord2 = tuple(3 if s == Infinity else s - 1 for s in board.shape)
 
-            ranges = [range(c1, 1 + c2) for (c1, c2) in zip(coord1, coord2)]
-            expected_results = itertools.product(*ranges)
-            actual = board.itercoords(coord1, coord2)
-            self.assertEqual(list(expected_results), list(actual), name)
+                ranges = [range(c1, 1 + c2) for (c1, c2) in zip(coord1, coord2)]
+                expected = itertools.product(*ranges)
+                actual = board.itercoords(coord1, coord2)
+                self.assertIteratesAs(actual, expected, name)
 
     def test_itercoords_off_board(self):
         #
@@ -251,15 +308,16 @@ class BoardIteration(BoardTest):
         # raise an exception
         #
         for name, board in self.boards:
-            #
-            # Skip entirely infinite boards and nothing is off-board for them!
-            #
-            if board.has_infinite_dimensions and not board.has_finite_dimensions:
-                continue
-            coord1 = tuple(2 + len(d) for d in board.dimensions)
-            coord2 = tuple(0 for d in board.dimensions)
-            with self.assertRaises(Board.OutOfBoundsError, msg=name):
-                next(board.itercoords(coord1, coord2))
+            with self.subTest(name=name):
+                #
+                # Skip entirely infinite boards and nothing is off-board for them!
+                #
+                if board.has_infinite_dimensions and not board.has_finite_dimensions:
+                    continue
+                coord1 = tuple(2 + s for s in board.shape)
+                coord2 = (0,) * len(board.dimensions)
+                with self.assertRaises(Board.OutOfBoundsError, msg=name):
+                    next(board.itercoords(coord1, coord2))
 
 class BoardCopy(BoardTest):
     """Copying a board results in a new board, optionally containing
@@ -273,18 +331,20 @@ class BoardCopy(BoardTest):
         # with the same dimensionality
         #
         for name, board in self.boards:
-            board2 = board.copy(with_data=False)
-            expected = board.dimensions
-            actual = board2.dimensions
-            self.assertEqual(expected, actual, name)
+            with self.subTest(name=name):
+                board2 = board.copy(with_data=False)
+                expected = board.dimensions
+                actual = board2.dimensions
+                self.assertEqual(expected, actual, name)
 
     def test_copy_without_data_empty(self):
         #
         # Copying a board without data results in a second empty board
         #
         for name, board in self.boards:
-            board2 = board.copy(with_data=False)
-            self.assertFalse(board2, name)
+            with self.subTest(name=name):
+                board2 = board.copy(with_data=False)
+                self.assertFalse(board2, name)
 
     def test_copy_without_data_unlinked(self):
         #
@@ -292,13 +352,14 @@ class BoardCopy(BoardTest):
         # not linked to the first
         #
         for name, board in self.boards:
-            board2 = board.copy(with_data=False)
-            obj = object()
-            coord = tuple(0 for _ in board2.dimensions)
-            board2[coord] = obj
-            expected = obj
-            actual = board[coord]
-            self.assertIsNot(expected, actual, name)
+            with self.subTest(name=name):
+                board2 = board.copy(with_data=False)
+                obj = object()
+                coord = (0,) * len(board2.dimensions)
+                board2[coord] = obj
+                expected = obj
+                actual = board[coord]
+                self.assertIsNot(expected, actual, name)
 
     def test_copy_with_data_dimensions(self):
         #
@@ -306,10 +367,11 @@ class BoardCopy(BoardTest):
         # with the same dimensionality
         #
         for name, board in self.boards:
-            board2 = board.copy(with_data=True)
-            expected = board.dimensions
-            actual = board2.dimensions
-            self.assertEqual(expected, actual, name)
+            with self.subTest(name=name):
+                board2 = board.copy(with_data=True)
+                expected = board.dimensions
+                actual = board2.dimensions
+                self.assertEqual(expected, actual, name)
 
     def test_copy_with_data_same_data(self):
         #
@@ -317,24 +379,43 @@ class BoardCopy(BoardTest):
         # with the same data
         #
         for name, board in self.boards:
-            board2 = board.copy(with_data=True)
-            expected = set(board.iterdata())
-            actual = set(board2.iterdata())
-            self.assertSetEqual(expected, actual, name)
+            with self.subTest(name=name):
+                board2 = board.copy(with_data=True)
+                expected = board.asdict()
+                actual = board2.asdict()
+                self.assertEqual(expected, actual, name)
 
     def test_copy_with_data_unlinked(self):
         #
-        # Copying a board without data results in a second board
-        # not linked to the first
+        # Copying a board with data results in a second board
+        # not linked to the first. This is the one place where a
+        # full copy is checked for linkage: owning boards and slices
+        # take different copy paths, so it is still run per board.
+        #
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                board2 = board.copy(with_data=True)
+                obj = object()
+                coord = (0,) * len(board2.dimensions)
+                board2[coord] = obj
+                expected = obj
+                actual = board[coord]
+                self.assertIsNot(expected, actual, name)
+
+    def test_asdict(self):
+        #
+        # asdict gives the board's local data as a new dictionary
+        # not linked to the board
         #
         for name, board in self.boards:
-            board2 = board.copy(with_data=True)
-            obj = object()
-            coord = tuple(0 for _ in board2.dimensions)
-            board2[coord] = obj
-            expected = obj
-            actual = board[coord]
-            self.assertIsNot(expected, actual, name)
+            with self.subTest(name=name):
+                data = board.asdict()
+                self.assertEqual(dict(board.iterdata()), data, name)
+
+                coord = (0,) * len(board.dimensions)
+                obj = object()
+                data[coord] = obj
+                self.assertIsNot(obj, board[coord], name)
 
 class BoardClear(BoardTest):
     """Clearing the board removes all the data visible to the local board.
@@ -342,37 +423,65 @@ class BoardClear(BoardTest):
     which fall within the local coordinate space are removed;
     """
 
+    def setUp(self):
+        super(BoardClear, self).setUp()
+        #
+        # Some of the boards are linked, so clearing one can empty
+        # another. Remember each board's populated state so that each
+        # test can restore a board with .reset once it's cleared it.
+        #
+        for name, board in self.boards:
+            board.snapshot()
+
     def test_clear(self):
         for name, board in self.boards:
-            board.populate(self.test_data)
-            self.assertNotEqual(list(board.iterdata()), [], name)
-            board.clear()
-            expected = []
-            actual = list(board.iterdata())
-            self.assertEqual(expected, actual, name)
+            with self.subTest(name=name):
+                self.assertNotEqual(list(board.iterdata()), [], name)
+                board.clear()
+                expected = []
+                actual = list(board.iterdata())
+                self.assertEqual(expected, actual, name)
+                board.reset()
 
     def test_clear_offset_board(self):
         """Test that an offset board clears its own values only"""
         for name, board in self.boards:
-            if any(len(d) == 1 for d in board.dimensions):
-                continue # Won't try to slice a 1-element dimension
-            board.populate(self.test_data)
-            offset = tuple(1 for _ in board.dimensions)
-            coord_slices = tuple(slice(o, None) for o in offset)
-            board2 = board[coord_slices]
-
-            #
-            # Check that both boards are non-empty
-            #
-            self.assertNotEqual(list(board.iterdata()), [], name)
-            self.assertNotEqual(list(board2.iterdata()), [], name)
-            board2.clear()
-            #
-            # Now check that the second board is empty while its
-            # parent is still (part-) populated
-            #
-            self.assertNotEqual(list(board.iterdata()), [], name)
-            self.assertEqual(list(board2.iterdata()), [], name)
+            with self.subTest(name=name):
+                if 1 in board.shape:
+                    continue # Won't try to slice a 1-element dimension
+                offset = (1,) * len(board.dimensions)
+                coord_slices = tuple(slice(o, None) for o in offset)
+                board2 = board[coord_slices]
+
+                #
+                # Check that both boards are non-empty
+                #
+                self.assertNotEqual(list(board.iterdata()), [], name)
+                self.assertNotEqual(list(board2.iterdata()), [], name)
+                board2.clear()
+                #
+                # Now check that the second board is empty while its
+                # parent is still (part-) populated
+                #
+                self.assertNotEqual(list(board.iterdata()), [], name)
+                self.assertEqual(list(board2.iterdata()), [], name)
+                board.reset()
+
+    def test_reset(self):
+        """Test that reset restores the data as it was at the last snapshot"""
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                expected = board.asdict()
+                board.clear()
+                board[(0,) * len(board.dimensions)] = object()
+                board.reset()
+                actual = board.asdict()
+                self.assertEqual(expected, actual, name)
+
+    def test_reset_without_snapshot(self):
+        board = Board((3, 3))
+        with self.assertRaises(Board.BoardError):
+            board.reset()
 
 class BoardItemAccess(BoardTest):
     """Test access via __getitem__, __setitem__ and __delitem__
@@ -384,52 +493,106 @@ class BoardItemAccess(BoardTest):
 
     def test_getitem_value(self):
         for name, board in self.boards:
-            board.populate(self.test_data)
-            coord = tuple(0 for _ in board.dimensions)
-
-            expected = self.test_data[0]
-            actual = board[coord]
-            self.assertEqual(expected, actual, name)
+            with self.subTest(name=name):
+                #
+                # The fixture boards are already populated from the start of the
+                # test data; a slice starts out showing part of its parent's data
+                #
+                if board.is_offset:
+                    board.populate(self.test_data)
+                coord = (0,) * len(board.dimensions)
+
+                expected = self.test_data[0]
+                actual = board[coord]
+                self.assertEqual(expected, actual, name)
 
     def test_getitem_no_value(self):
         for name, board in self.boards:
-            board.clear()
-            coord = tuple(0 for _ in board.dimensions)
+            with self.subTest(name=name):
+                board.clear()
+                coord = (0,) * len(board.dimensions)
 
-            expected = Empty
-            actual = board[coord]
-            self.assertIs(expected, actual, name)
+                expected = Empty
+                actual = board[coord]
+                self.assertIs(expected, actual, name)
 
     def test_setitem_value(self):
         for name, board in self.boards:
-            coord = tuple(0 for _ in board.dimensions)
-            obj = object()
-            board[coord] = obj
+            with self.subTest(name=name):
+                coord = (0,) * len(board.dimensions)
+                obj = object()
+                board[coord] = obj
 
-            expected = obj
-            actual = board[coord]
-            self.assertIs(expected, actual, name)
+                expected = obj
+                actual = board[coord]
+                self.assertIs(expected, actual, name)
 
     def test_delitem_value(self):
         for name, board in self.boards:
-            board.populate(self.test_data)
-            coord = tuple(0 for _ in board.dimensions)
-            del board[coord]
+            with self.subTest(name=name):
+                coord = (0,) * len(board.dimensions)
+                del board[coord]
 
-            expected = Empty
-            actual = board[coord]
-            self.assertIs(expected, actual, name)
+                expected = Empty
+                actual = board[coord]
+                self.assertIs(expected, actual, name)
+
+    def test_update(self):
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                board.clear()
+                coord1 = (0,) * len(board.dimensions)
+                coord2 = tuple(0 if s == Infinity else s - 1 for s in board.shape)
+                board.update([(coord1, "a"), (coord2, "b")])
+
+                expected = {coord1: "a", coord2: "b"}
+                actual = board.asdict()
+                self.assertEqual(expected, actual, name)
+
+    def test_update_out_of_bounds(self):
+        """Check that nothing is written if any coordinate is out of bounds
+        """
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                if board.has_infinite_dimensions and not board.has_finite_dimensions:
+                    continue # Won't try to check out-of-bounds on an entirely infinite board!
+                board.clear()
+                coord1 = (0,) * len(board.dimensions)
+                coord2 = tuple(2 + s for s in board.shape)
+                with self.assertRaises(Board.OutOfBoundsError, msg=name):
+                    board.update({coord1: "a", coord2: "b"})
+                self.assertFalse(board, name)
+
+    def test_update_fractional(self):
+        """Check that nothing is written if any coordinate isn't a whole number
+        """
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                board.clear()
+                coord1 = (0,) * len(board.dimensions)
+                coord2 = (0.5,) * len(board.dimensions)
+                with self.assertRaises(Board.OutOfBoundsError, msg=name):
+                    board.update({coord1: "a", coord2: "b"})
+                self.assertFalse(board, name)
+
+    def test_delitem_fractional(self):
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                coord = (0.5,) * len(board.dimensions)
+                with self.assertRaises(Board.OutOfBoundsError, msg=name):
+                    del board[coord]
 
     def test_out_of_bounds(self):
         """Check that an OutOfBoundsError is raised when the coordinate is outside
         the local coordinate space
         """
         for name, board in self.boards:
-            if board.has_infinite_dimensions and not board.has_finite_dimensions:
-                continue # Won't try to check out-of-bounds on an entirely infinite board!
-            coord = tuple(2 + len(d) for d in board.dimensions)
-            with self.assertRaises(Board.OutOfBoundsError, msg=name):
-                board[coord]
+            with self.subTest(name=name):
+                if board.has_infinite_dimensions and not board.has_finite_dimensions:
+                    continue # Won't try to check out-of-bounds on an entirely infinite board!
+                coord = tuple(2 + s for s in board.shape)
+                with self.assertRaises(Board.OutOfBoundsError, msg=name):
+                    board[coord]
 
     def test_negative_getitem(self):
         """Check that a -1 index refers to the value at the last point on each
@@ -445,16 +608,28 @@ class BoardItemAccess(BoardTest):
         #
 
         for name, board in self.boards:
-            if board.has_infinite_dimensions and not board.has_finite_dimensions:
-                continue # Won't try to check for negative index an entirely infinite board
-            coord = tuple(0 if d[-1] == Infinity else -1 for d in board.dimensions)
-            real_coord = tuple(0 if d[-1] == Infinity else len(d) -1 for d in board.dimensions)
-            obj = object()
-            board[real_coord] = obj
-
-            expected = obj
-            actual = board[real_coord]
-            self.assertIs(expected, actual, name)
+            with self.subTest(name=name):
+                if board.has_infinite_dimensions and not board.has_finite_dimensions:
+                    continue # Won't try to check for negative index an entirely infinite board
+                coord = tuple(0 if d.is_infinite else -1 for d in board.dimensions)
+                real_coord = tuple(0 if s == Infinity else s - 1 for s in board.shape)
+                obj = object()
+                board[real_coord] = obj
+
+                expected = obj
+                actual = board[coord]
+                self.assertIs(expected, actual, name)
+
+    def test_negative_index_infinite(self):
+        """Check that a negative index on an infinite dimension is rejected
+        """
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                if not board.has_infinite_dimensions:
+                    continue
+                coord = tuple(-1 if s == Infinity else 0 for s in board.shape)
+                with self.assertRaises(IndexError, msg=name):
+                    board[coord]
 
 class BoardSliced(BoardTest):
 
@@ -464,12 +639,12 @@ class BoardSliced(BoardTest):
         # with the same dimensionality
         #
         for name, board in self.boards:
-            coord_slices = tuple(slice(0, None) for _ in board.dimensions)
-            board2 = board[coord_slices]
+            with self.subTest(name=name):
+                board2 = board[board.full_slice]
 
-            expected = board.dimensions
-            actual = board2.dimensions
-            self.assertEqual(expected, actual, name)
+                expected = board.dimensions
+                actual = board2.dimensions
+                self.assertEqual(expected, actual, name)
 
     def test_slice_whole_same_data(self):
         #
@@ -477,9 +652,9 @@ class BoardSliced(BoardTest):
         # with the same data
         #
         for name, board in self.boards:
-            coord_slices = tuple(slice(0, None) for _ in board.dimensions)
-            board2 = board[coord_slices]
-            self.assertTrue(all(d1 == d2 for (d1, d2) in zip(board.iterdata(), board2.iterdata())), name)
+            with self.subTest(name=name):
+                board2 = board[board.full_slice]
+                self.assertTrue(all(d1 == d2 for (d1, d2) in zip(board.iterdata(), board2.iterdata())), name)
 
     def test_slice_whole_linked(self):
         #
@@ -487,20 +662,20 @@ class BoardSliced(BoardTest):
         # such that a change to the data in one affects the other
         #
         for name, board in self.boards:
-            coord_slices = tuple(slice(0, None) for _ in board.dimensions)
-            board2 = board[coord_slices]
+            with self.subTest(name=name):
+                board2 = board[board.full_slice]
 
-            #
-            # Update the second board at (0, ...) and confirm that
-            # the first board has the same data at the same position
-            #
-            obj = object()
-            coord = tuple(0 for _ in board2.dimensions)
-            board2[coord] = obj
+                #
+                # Update the second board at (0, ...) and confirm that
+                # the first board has the same data at the same position
+                #
+                obj = object()
+                coord = (0,) * len(board2.dimensions)
+                board2[coord] = obj
 
-            expected = obj
-            actual = board[coord]
-            self.assertIs(expected, actual, name)
+                expected = obj
+                actual = board[coord]
+                self.assertIs(expected, actual, name)
 
     #
     # Test a slice which has a start point but is open-ended
@@ -511,44 +686,46 @@ class BoardSliced(BoardTest):
 
     def test_slice_part_open_dimensions(self):
         for name, board in self.boards:
-            if any(len(d) == 1 for d in board.dimensions):
-                continue # Won't try to slice a 1-element dimension
-            #
-            # Slice to exclude the 0th element
-            #
-            offset = tuple(1 for _ in board.dimensions)
-            coord_slices = tuple(slice(o, None) for o in offset)
-            board2 = board[coord_slices]
-
-            #
-            # (Infinite dimensions remain infinite)
-            #
-            expected = [len(d) if d is InfiniteDimension else len(d) -1 for d in board.dimensions]
-            actual = [len(d) for d in board2.dimensions]
-            self.assertEqual(expected, actual, name)
+            with self.subTest(name=name):
+                if 1 in board.shape:
+                    continue # Won't try to slice a 1-element dimension
+                #
+                # Slice to exclude the 0th element
+                #
+                offset = (1,) * len(board.dimensions)
+                coord_slices = tuple(slice(o, None) for o in offset)
+                board2 = board[coord_slices]
+
+                #
+                # (Infinite dimensions remain infinite)
+                #
+                expected = [s if s == Infinity else s - 1 for s in board.shape]
+                actual = list(board2.shape)
+                self.assertEqual(expected, actual, name)
 
     def test_slice_part_open_linked(self):
         for name, board in self.boards:
-            if any(len(d) == 1 for d in board.dimensions):
-                continue # Won't try to slice a 1-element dimension
-            #
-            # Slice to exclude the 0th element
-            #
-            offset = tuple(1 for _ in board.dimensions)
-            coord_slices = tuple(slice(o, None) for o in offset)
-            board2 = board[coord_slices]
-
-            #
-            # Data at (0, ...) in the second board should match (1, ...) in the first
-            #
-            coord2 = tuple(0 for _ in board2.dimensions)
-            coord1 = tuple(i + o for (i, o) in zip(coord2, offset))
-            obj = object()
-            board2[coord2] = obj
-
-            expected = board[coord1]
-            actual = board2[coord2]
-            self.assertIs(expected, actual, name)
+            with self.subTest(name=name):
+                if 1 in board.shape:
+                    continue # Won't try to slice a 1-element dimension
+                #
+                # Slice to exclude the 0th element
+                #
+                offset = (1,) * len(board.dimensions)
+                coord_slices = tuple(slice(o, None) for o in offset)
+                board2 = board[coord_slices]
+
+                #
+                # Data at (0, ...) in the second board should match (1, ...) in the first
+                #
+                coord2 = (0,) * len(board2.dimensions)
+                coord1 = tuple(map(operator.add, coord2, offset))
+                obj = object()
+                board2[coord2] = obj
+
+                expected = board[coord1]
+                actual = board2[coord2]
+                self.assertIs(expected, actual, name)
 
     #
     # Test a slice which has a start and an end point
@@ -559,46 +736,48 @@ class BoardSliced(BoardTest):
 
     def test_slice_part_closed_dimensions(self):
         for name, board in self.boards:
-            if any(len(d) == 1 for d in board.dimensions):
-                continue # Won't try to slice a 1-element dimension
-            #
-            # Slice to include the 0th element
-            #
-            offset_start = tuple(0 for _ in board.dimensions)
-            offset_stop = tuple(1 for _ in board.dimensions)
-            coord_slices = tuple(slice(o0, o1) for (o0, o1) in zip(offset_start, offset_stop))
-            board2 = board[coord_slices]
-
-            #
-            # (Infinite dimensions become finite)
-            #
-            expected = [o1 - o0 for (o0, o1) in zip(offset_start, offset_stop)]
-            actual = [len(d) for d in board2.dimensions]
-            self.assertEqual(expected, actual, name)
+            with self.subTest(name=name):
+                if 1 in board.shape:
+                    continue # Won't try to slice a 1-element dimension
+                #
+                # Slice to include the 0th element
+                #
+                offset_start = (0,) * len(board.dimensions)
+                offset_stop = (1,) * len(board.dimensions)
+                coord_slices = tuple(map(slice, offset_start, offset_stop))
+                board2 = board[coord_slices]
+
+                #
+                # (Infinite dimensions become finite)
+                #
+                expected = list(map(operator.sub, offset_stop, offset_start))
+                actual = list(board2.shape)
+                self.assertEqual(expected, actual, name)
 
     def test_slice_part_closed_linked(self):
         for name, board in self.boards:
-            if any(len(d) == 1 for d in board.dimensions):
-                continue # Won't try to slice a 1-element dimension
-            #
-            # Slice to include the 0th element
-            #
-            offset_start = tuple(0 for _ in board.dimensions)
-            offset_stop = tuple(1 for _ in board.dimensions)
-            coord_slices = tuple(slice(o0, o1) for (o0, o1) in zip(offset_start, offset_stop))
-            board2 = board[coord_slices]
-
-            #
-            # Data at (0, ...) in the second board should match (1, ...) in the first
-            #
-            coord2 = tuple(0 for _ in board2.dimensions)
-            coord1 = tuple(i + o for (i, o) in zip(coord2, offset_start))
-            obj = object()
-            board2[coord2] = obj
-
-            expected = board[coord1]
-            actual = board2[coord2]
-            self.assertIs(expected, actual, name)
+            with self.subTest(name=name):
+                if 1 in board.shape:
+                    continue # Won't try to slice a 1-element dimension
+                #
+                # Slice to include the 0th element
+                #
+                offset_start = (0,) * len(board.dimensions)
+                offset_stop = (1,) * len(board.dimensions)
+                coord_slices = tuple(map(slice, offset_start, offset_stop))
+                board2 = board[coord_slices]
+
+                #
+                # Data at (0, ...) in the second board should match (1, ...) in the first
+                #
+                coord2 = (0,) * len(board2.dimensions)
+                coord1 = tuple(map(operator.add, coord2, offset_start))
+                obj = object()
+                board2[coord2] = obj
+
+                expected = board[coord1]
+                actual = board2[coord2]
+                self.assertIs(expected, actual, name)
 
 class BoardDunders(BoardTest):
     """Sundry dunder methods such as __eq__, __len__ and so on
@@ -611,34 +790,37 @@ class BoardDunders(BoardTest):
 
     def test_eq(self):
         for name, board in self.boards:
-            board.populate(self.test_data)
-            board2 = board.copy(with_data=True)
-            self.assertEqual(board, board2, name)
+            with self.subTest(name=name):
+                board2 = board.copy(with_data=True)
+                self.assertEqual(board, board2, name)
 
     def test_eq_empty(self):
         for name, board in self.boards:
-            board.clear()
-            board2 = board.copy(with_data=True)
-            self.assertEqual(board, board2, name)
+            with self.subTest(name=name):
+                board.clear()
+                board2 = board.copy(with_data=True)
+                self.assertEqual(board, board2, name)
 
     def test_eq_different_dimensionality(self):
         for name, board in self.boards:
-            dimension_sizes2 = tuple([len(d) for d in board.dimensions] + [1])
-            board2 = Board(dimension_sizes2)
-            self.assertNotEqual(board, board2, name)
+            with self.subTest(name=name):
+                dimension_sizes2 = board.shape + (1,)
+                board2 = Board(dimension_sizes2)
+                self.assertNotEqual(board, board2, name)
 
     def test_eq_different_dimensions(self):
         for name, board in self.boards:
-            dimension_sizes2 = tuple(1 if len(d) == Infinity else len(d) + 1 for d in board.dimensions)
-            board2 = Board(dimension_sizes2)
-            self.assertNotEqual(board, board2, name)
+            with self.subTest(name=name):
+                dimension_sizes2 = tuple(1 if s == Infinity else s + 1 for s in board.shape)
+                board2 = Board(dimension_sizes2)
+                self.assertNotEqual(board, board2, name)
 
     def test_eq_different_data(self):
         for name, board in self.boards:
-            board.populate(self.test_data)
-            board2 = board.copy(with_data=True)
-            board2.populate(reversed(self.test_data))
-            self.assertNotEqual(board, board2, name)
+            with self.subTest(name=name):
+                board2 = board.copy(with_data=True)
+                board2[(0,) * len(board2.dimensions)] = object()
+                self.assertNotEqual(board, board2, name)
 
     #
     # The length of a board is the product of its dimension lengths,
@@ -648,23 +830,23 @@ class BoardDunders(BoardTest):
 
     def test_len_finite(self):
         for name, board in self.boards:
-            if board.has_infinite_dimensions:
-                continue
+            with self.subTest(name=name):
+                if board.has_infinite_dimensions:
+                    continue
 
-            expected = 1
-            for d in board.dimensions:
-                expected *= len(d)
-            actual = len(board)
-            self.assertEqual(expected, actual, name)
+                expected = math.prod(board.shape)
+                actual = len(board)
+                self.assertEqual(expected, actual, name)
 
     def test_len_infinite(self):
         for name, board in self.boards:
-            if not board.has_infinite_dimensions:
-                continue
+            with self.subTest(name=name):
+                if not board.has_infinite_dimensions:
+                    continue
 
-            expected = Infinity
-            actual = len(board)
-            self.assertEqual(expected, actual, name)
+                expected = Infinity
+                actual = len(board)
+                self.assertEqual(expected, actual, name)
 
     #
     # Not really a dunder method, but masquerading as one
@@ -673,34 +855,37 @@ class BoardDunders(BoardTest):
 
     def test_lendata_empty(self):
         for name, board in self.boards:
-            board.clear()
+            with self.subTest(name=name):
+                board.clear()
 
-            expected = 0
-            actual = board.lendata()
-            self.assertEqual(expected, actual, name)
+                expected = 0
+                actual = board.lendata()
+                self.assertEqual(expected, actual, name)
 
     def test_lendata_1(self):
         for name, board in self.boards:
-            board.clear()
-            board[tuple(0 for _ in board.dimensions)] = object()
+            with self.subTest(name=name):
+                board.clear()
+                board[(0,) * len(board.dimensions)] = object()
 
-            expected = 1
-            actual = board.lendata()
-            self.assertEqual(expected, actual, name)
+                expected = 1
+                actual = board.lendata()
+                self.assertEqual(expected, actual, name)
 
     def test_lendata_full(self):
         for name, board in self.boards:
-            board.clear()
-            board.populate(self.test_data)
-            #
-            # Population will stop when it runs out of data or when it
-            # runs out of board to populate. The resulting data will
-            # be the smaller of the board size and data length
-            #
+            with self.subTest(name=name):
+                board.clear()
+                board.populate(self.test_data)
+                #
+                # Population will stop when it runs out of data or when it
+                # runs out of board to populate. The resulting data will
+                # be the smaller of the board size and data length
+                #
 
-            expected = min(len(board), len(self.test_data))
-            actual = board.lendata()
-            self.assertEqual(expected, actual, name)
+                expected = min(len(board), len(self.test_data))
+                actual = board.lendata()
+                self.assertEqual(expected, actual, name)
 
     #
     # A board is considered true if it has at least one position
@@ -709,13 +894,14 @@ class BoardDunders(BoardTest):
 
     def test_bool_empty(self):
         for name, board in self.boards:
-            board.clear()
-            self.assertFalse(board, name)
+            with self.subTest(name=name):
+                board.clear()
+                self.assertFalse(board, name)
 
     def test_bool_nonempty(self):
         for name, board in self.boards:
-            board.populate([object()])
-            self.assertTrue(board, name)
+            with self.subTest(name=name):
+                self.assertTrue(board, name)
 
 class BoardOccupied(BoardTest):
     """Check the determination of the bounding box of occupied positions
@@ -724,33 +910,59 @@ class BoardOccupied(BoardTest):
         """If the board is empty, a pair of empty tuples will be returned
         """
         for name, board in self.boards:
-            board.clear()
+            with self.subTest(name=name):
+                board.clear()
 
-            expected = (), ()
-            actual = board.occupied()
-            self.assertEqual(expected, actual, name)
+                expected = (), ()
+                actual = board.occupied()
+                self.assertEqual(expected, actual, name)
 
     def test_single_position(self):
         for name, board in self.boards:
-            board.clear()
-            min_coord = max_coord = tuple(0 for _ in board.dimensions)
-            board[min_coord] = object()
+            with self.subTest(name=name):
+                board.clear()
+                min_coord = max_coord = (0,) * len(board.dimensions)
+                board[min_coord] = object()
 
-            expected = min_coord, max_coord
-            actual = board.occupied()
-            self.assertEqual(expected, actual, name)
+                expected = min_coord, max_coord
+                actual = board.occupied()
+                self.assertEqual(expected, actual, name)
 
     def test_square(self):
         for name, board in self.boards:
-            board.clear()
-            min_coord = tuple(0 for _ in board.dimensions)
-            max_coord = tuple(0 if d.is_infinite else len(d) - 1 for d in board.dimensions)
-            board[min_coord] = object()
-            board[max_coord] = object()
+            with self.subTest(name=name):
+                board.clear()
+                min_coord = (0,) * len(board.dimensions)
+                max_coord = tuple(0 if s == Infinity else s - 1 for s in board.shape)
+                board[min_coord] = object()
+                board[max_coord] = object()
 
-            expected = min_coord, max_coord
-            actual = board.occupied()
-            self.assertEqual(expected, actual, name)
+                expected = min_coord, max_coord
+                actual = board.occupied()
+                self.assertEqual(expected, actual, name)
+
+    #
+    # A range of bounding boxes on the same small board: each case clears
+    # the board and writes only its own positions
+    #
+    bounding_boxes = [
+        ([(1, 1)], ((1, 1), (1, 1))),
+        ([(0, 2), (2, 0)], ((0, 0), (2, 2))),
+        ([(0, 1), (1, 1), (2, 1)], ((0, 1), (2, 1))),
+        ([(1, 0), (1, 2)], ((1, 0), (1, 2))),
+        ([(2, 2), (1, 2)], ((1, 2), (2, 2))),
+    ]
+
+    def test_bounding_boxes(self):
+        b = Board((3, 3))
+        for coords, expected in self.bounding_boxes:
+            with self.subTest(coords=coords):
+                b.clear()
+                for coord in coords:
+                    b[coord] = object()
+
+                actual = b.occupied()
+                self.assertEqual(expected, actual, coords)
 
 class BoardEdges(BoardTest):
     """Check the detection and generation of edges
@@ -761,26 +973,22 @@ class BoardEdges(BoardTest):
     """
     def test_is_edge(self):
         for name, board in self.boards:
-            if all(d.is_finite for d in board.dimensions):
-                length = len(board)
-            elif any(d.is_finite for d in board.dimensions):
-                max_finite_length = max(len(d) for d in board.dimensions if d.is_finite)
-                length = functools.reduce(lambda a, b: a * b, (len(d) if d.is_finite else max_finite_length for d in board.dimensions))
-            else:
-                length = 100
-
-            n = 0
-            for coord in board:
-                if 0 in coord:
-                    self.assertTrue(board.is_edge(coord), name)
-                elif any(c == len(d) - 1 for c, d in zip(coord, board.dimensions)):
-                    self.assertTrue(board.is_edge(coord), name)
+            with self.subTest(name=name):
+                if not board.has_infinite_dimensions:
+                    length = len(board)
+                elif board.has_finite_dimensions:
+                    max_finite_length = max(s for s in board.shape if s != Infinity)
+                    length = math.prod(max_finite_length if s == Infinity else s for s in board.shape)
                 else:
-                    self.assertFalse(board.is_edge(coord), name)
-
-                n += 1
-                if n > length: break
+                    length = 100
 
+                for coord in itertools.islice(board, length):
+                    if 0 in coord:
+                        self.assertTrue(board.is_edge(coord), name)
+                    elif any(c == s - 1 for c, s in zip(coord, board.shape)):
+                        self.assertTrue(board.is_edge(coord), name)
+                    else:
+                        self.assertFalse(board.is_edge(coord), name)
 
 class BoardNeighbours(BoardTest):
     """Check that neighbours work correctly
@@ -964,14 +1172,142 @@ class BoardNeighbours(BoardTest):
         for dx in (-1, 0, 1):
             for dy in (-1, 0, 1):
                 for dz in (-1, 0, 1):
-                    offset = (dx, dy, dz)
                     # exclude the origin offset (0,0,0).
                     # exclude any offset where more than one dimension changes (diagonal)
-                    if offset != (0, 0, 0) and sum(abs(o) for o in offset) == 1:
+                    if abs(dx) + abs(dy) + abs(dz) == 1:
                         expected.add((x + dx, y + dy, z + dz))
 
         actual = set(b.neighbours((1, 1, 1), include_diagonals=False))
         self.assertEqual(expected, actual)
 
+    def test_neighbour_count(self):
+        """The neighbour count matches the number of neighbours generated,
+        with and without diagonals and at a range of radii
+        """
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                for coord in itertools.islice(board, 30):
+                    for radius in (1, 2):
+                        for include_diagonals in (True, False):
+                            expected = len(list(board.neighbours(coord, include_diagonals, radius)))
+                            actual = board.neighbour_count(coord, include_diagonals, radius)
+                            self.assertEqual(expected, actual, (name, coord, radius, include_diagonals))
+
+    def test_neighbour_count_far_along_infinite(self):
+        """The neighbour count is right far along an infinite dimension
+        """
+        b = Board((3, Infinity))
+        for coord in (1, sys.maxsize), (0, sys.maxsize - 1), (2, sys.maxsize + 1):
+            for radius in (1, 2):
+                for include_diagonals in (True, False):
+                    with self.subTest(coord=coord, radius=radius, include_diagonals=include_diagonals):
+                        expected = len(list(b.neighbours(coord, include_diagonals, radius)))
+                        actual = b.neighbour_count(coord, include_diagonals, radius)
+                        self.assertEqual(expected, actual)
+
+    def test_neighbour_count_fractional(self):
+        """Neighbours can only be counted for a coordinate of integers
+        """
+        b = Board((3, 3))
+        for include_diagonals in (True, False):
+            with self.subTest(include_diagonals=include_diagonals):
+                with self.assertRaises(TypeError):
+                    b.neighbour_count((0.5, 1), include_diagonals)
+
+    def test_neighbours_repeated(self):
+        """Asking again for the same neighbours gives the same answer,
+        and each answer can be consumed independently of the others
+        """
+        for name, board in self.boards:
+            with self.subTest(name=name):
+                coord = (0,) * len(board.dimensions)
+                expected = list(board.neighbours(coord))
+                neighbours1 = board.neighbours(coord)
+                neighbours2 = board.neighbours(coord)
+                self.assertEqual(expected, list(neighbours1), name)
+                self.assertEqual(expected, list(neighbours2), name)
+
+    def test_neighbours_remembered(self):
+        """On a small board, asking again for the immediate neighbours of
+        a position gives back the very same coordinates
+        """
+        b = Board((3, 3))
+        for include_diagonals in (True, False):
+            with self.subTest(include_diagonals=include_diagonals):
+                neighbours1 = list(b.neighbours((1, 1), include_diagonals))
+                neighbours2 = list(b.neighbours((1, 1), include_diagonals))
+                self.assertEqual(len(neighbours1), len(neighbours2))
+                for n1, n2 in zip(neighbours1, neighbours2):
+                    self.assertIs(n1, n2)
+
+    def test_neighbours_large_board(self):
+        """A board too large to remember its neighbours gives the same
+        neighbours on every call
+        """
+        b = Board((Board.small_board_threshold + 1, 3))
+        coord = (Board.small_board_threshold // 2, 1)
+        expected = list(b.neighbours(coord))
+        actual = list(b.neighbours(coord))
+        self.assertEqual(expected, actual)
+        self.assertEqual(8, len(actual))
+
+    def test_neighbours_fractional(self):
+        """Neighbours can only be found for a coordinate of integers
+        """
+        b = Board((3, 3))
+        for include_diagonals in (True, False):
+            with self.subTest(include_diagonals=include_diagonals):
+                with self.assertRaises(TypeError):
+                    b.neighbours((0.5, 1), include_diagonals)
+
+    def test_neighbours_2x2(self):
+        """On a 2x2 board every other position neighbours a corner
+        """
+        b = Board((2, 2))
+
+        coord = (0, 0)
+        expected = [(0, 1), (1, 0), (1, 1)]
+        actual = sorted(b.neighbours(coord))
+        self.assertEqual(expected, actual)
+
+        expected = [(0, 1), (1, 0)]
+        actual = sorted(b.neighbours(coord, include_diagonals=False))
+        self.assertEqual(expected, actual)
+
+    def test_neighbours_big_board_radius(self):
+        """A radius well inside a large board gives the whole surrounding
+        square; at the corners it's cut off by the edges of the board
+        """
+        b = Board((32, 64))
+        radius = 3
+
+        expected = (2 * radius + 1) ** 2 - 1
+        actual = len(list(b.neighbours((10, 10), radius=radius)))
+        self.assertEqual(expected, actual)
+
+        expected = (radius + 1) ** 2 - 1
+        for coord in (0, 0), (31, 63):
+            actual = len(list(b.neighbours(coord, radius=radius)))
+            self.assertEqual(expected, actual, coord)
+
+    def test_neighbours_far_along_infinite(self):
+        """Far along an infinite dimension a coordinate still has
+        neighbours beyond it
+        """
+        b = Board((3, Infinity))
+        x, y = 1, sys.maxsize
+
+        expected = {(x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)} - {(x, y)}
+        actual = set(b.neighbours((x, y)))
+        self.assertEqual(expected, actual)
+
+        expected = {(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)}
+        actual = set(b.neighbours((x, y), include_diagonals=False))
+        self.assertEqual(expected, actual)
+
+        expected = {(0, y), (2, y), (1, y - 1), (1, y - 2), (1, y + 1), (1, y + 2)}
+        actual = set(b.neighbours((x, y), include_diagonals=False, radius=2))
+        self.assertEqual(expected, actual)
+
 if __name__ == '__main__':
     unittest.main()